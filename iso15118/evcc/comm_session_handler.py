@@ -11,7 +11,7 @@ import asyncio
 import logging
 from asyncio.streams import StreamReader, StreamWriter
 from ipaddress import IPv6Address
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from pydantic.error_wrappers import ValidationError
 
@@ -104,6 +104,9 @@ class EVCCCommunicationSession(V2GCommunicationSession):
         # Protocols supported by the EVCC as sent to the SECC via
         # the SupportedAppProtocolReq message
         self.supported_protocols: List[AppProtocol] = []
+        # The same protocols, keyed by the schema ID assigned to each of them in
+        # the SupportedAppProtocolReq, to look up the one the SECC chose
+        self.supported_protocols_by_schema_id: Dict[int, AppProtocol] = {}
         # The Ongoing timer (given in seconds) starts running once the EVCC
         # receives a response with the field EVSEProcessing set to 'Ongoing'.
         # Once the timer is up, the EV will terminate the communication session.
@@ -191,6 +194,9 @@ class EVCCCommunicationSession(V2GCommunicationSession):
             app_protocols.append(app_protocol_entry)
 
         self.supported_protocols = app_protocols
+        self.supported_protocols_by_schema_id = {
+            app_protocol.schema_id: app_protocol for app_protocol in app_protocols
+        }
         sap_req = SupportedAppProtocolReq(app_protocol=self.supported_protocols)
 
         return sap_req
@@ -3,7 +3,7 @@ import logging
 
 from iso15118.evcc import EVCCHandler
 from iso15118.evcc.controller.simulator import SimEVController
-from iso15118.shared.exificient_exi_codec import ExificientEXICodec
+from iso15118.shared.exificient_exi_codec import get_shared_exificient_codec
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ async def main():
     the EVCC (EV Communication Controller)
     """
     await EVCCHandler(
-        exi_codec=ExificientEXICodec(), ev_controller=SimEVController()
+        exi_codec=get_shared_exificient_codec(), ev_controller=SimEVController()
     ).start()
 
 
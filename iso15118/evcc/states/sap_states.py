@@ -7,7 +7,7 @@ SupportedAppProtocolReq and -Res message pair to mutually agree upon a protocol.
 
 import logging
 import time
-from typing import Type, Union
+from typing import Tuple, Type, Union
 
 from iso15118.evcc import evcc_settings
 from iso15118.evcc.comm_session_handler import EVCCCommunicationSession
@@ -20,13 +20,11 @@ from iso15118.shared.messages.app_protocol import (
     SupportedAppProtocolReq,
     SupportedAppProtocolRes,
 )
-from iso15118.shared.messages.din_spec.body import BodyBase as BodyBaseDINSPEC
 from iso15118.shared.messages.din_spec.body import (
     SessionSetupReq as SessionSetupReqDINSPEC,
 )
 from iso15118.shared.messages.din_spec.msgdef import V2GMessage as V2GMessageDINSPEC
 from iso15118.shared.messages.enums import Namespace, Protocol
-from iso15118.shared.messages.iso15118_2.body import BodyBase
 from iso15118.shared.messages.iso15118_2.body import (
     SessionSetupReq as SessionSetupReqV2,
 )
@@ -41,12 +39,71 @@ from iso15118.shared.messages.iso15118_20.common_types import (
 from iso15118.shared.messages.iso15118_20.common_types import (
     V2GMessage as V2GMessageV20,
 )
-from iso15118.shared.messages.iso15118_20.common_types import V2GRequest
 from iso15118.shared.messages.timeouts import Timeouts as TimeoutsShared
-from iso15118.shared.states import State, Terminate
+from iso15118.shared.states import State
 
 logger = logging.getLogger(__name__)
 
+ISO15118_2_NS = Protocol.ISO_15118_2.ns.value
+DIN_SPEC_70121_NS = Protocol.DIN_SPEC_70121.ns.value
+
+# The session ID the EVCC sends with its first SessionSetupReq (a single zero
+# byte, hex encoded), asking the SECC to set up a new session
+_DEFAULT_SESSION_ID = "00"
+
+SessionSetupReq = Union[SessionSetupReqV2, SessionSetupReqDINSPEC, SessionSetupReqV20]
+
+
+async def _build_session_setup_v2(
+    state: "SupportedAppProtocol", protocol_ns: str
+) -> Tuple[SessionSetupReq, Namespace, Type[State]]:
+    state.comm_session.protocol = Protocol.ISO_15118_2
+    state.comm_session.session_id = state.get_session_id()
+
+    next_msg = SessionSetupReqV2(
+        evcc_id=await state.comm_session.ev_controller.get_evcc_id(
+            Protocol.ISO_15118_2, state.comm_session.config.iface
+        )
+    )
+    return next_msg, Namespace.ISO_V2_MSG_DEF, SessionSetupV2
+
+
+async def _build_session_setup_din(
+    state: "SupportedAppProtocol", protocol_ns: str
+) -> Tuple[SessionSetupReq, Namespace, Type[State]]:
+    state.comm_session.protocol = Protocol.DIN_SPEC_70121
+    state.comm_session.session_id = state.get_session_id()
+
+    next_msg = SessionSetupReqDINSPEC(
+        evcc_id=await state.comm_session.ev_controller.get_evcc_id(
+            Protocol.DIN_SPEC_70121, state.comm_session.config.iface
+        )
+    )
+    return next_msg, Namespace.DIN_MSG_DEF, SessionSetupDINSPEC
+
+
+async def _build_session_setup_v20(
+    state: "SupportedAppProtocol", protocol_ns: str
+) -> Tuple[SessionSetupReq, Namespace, Type[State]]:
+    state.comm_session.protocol = Protocol.get_by_ns(protocol_ns)
+    header = MessageHeaderV20(session_id=state.get_session_id(), timestamp=time.time())
+    next_msg = SessionSetupReqV20(
+        header=header,
+        evcc_id=await state.comm_session.ev_controller.get_evcc_id(
+            state.comm_session.protocol, state.comm_session.config.iface
+        ),
+    )
+    return next_msg, Namespace.ISO_V20_COMMON_MSG, SessionSetupV20
+
+
+# Maps the namespace of the protocol chosen by the SECC to the function that
+# sets up the session accordingly and builds the SessionSetupReq to send next.
+# ISO 15118-20 namespaces are matched by their common prefix instead.
+_NS_DISPATCH = {
+    ISO15118_2_NS: _build_session_setup_v2,
+    DIN_SPEC_70121_NS: _build_session_setup_din,
+}
+
 
 class SupportedAppProtocol(StateEVCC):
     """
@@ -76,69 +133,28 @@ class SupportedAppProtocol(StateEVCC):
 
         sap_res: SupportedAppProtocolRes = msg
 
-        next_msg: Union[
-            SupportedAppProtocolReq,
-            SupportedAppProtocolRes,
-            BodyBase,
-            V2GRequest,
-            BodyBaseDINSPEC,
-        ] = SessionSetupReqV2(
-            evcc_id=await self.comm_session.ev_controller.get_evcc_id(
-                Protocol.ISO_15118_2, self.comm_session.config.iface
-            )
+        protocol = self.comm_session.supported_protocols_by_schema_id.get(
+            sap_res.schema_id
         )
-        next_ns: Namespace = Namespace.ISO_V2_MSG_DEF
-        next_state: Type[State] = Terminate  # some default that is not None
-        match = False
-
-        for protocol in self.comm_session.supported_protocols:
-            if protocol.schema_id == sap_res.schema_id:
-                match = True
-                if protocol.protocol_ns == Protocol.ISO_15118_2.ns.value:
-                    self.comm_session.protocol = Protocol.ISO_15118_2
-                    self.comm_session.session_id = self.get_session_id()
-                    # message is already set to SessionSetupReqV2 as default
-                    next_state = SessionSetupV2
-                elif protocol.protocol_ns == Protocol.DIN_SPEC_70121.ns.value:
-                    self.comm_session.protocol = Protocol.DIN_SPEC_70121
-                    self.comm_session.session_id = self.get_session_id()
-
-                    next_msg = SessionSetupReqDINSPEC(
-                        evcc_id=await self.comm_session.ev_controller.get_evcc_id(
-                            Protocol.DIN_SPEC_70121, self.comm_session.config.iface
-                        )
-                    )
-
-                    next_ns = Namespace.DIN_MSG_DEF
-                    next_state = SessionSetupDINSPEC
-                elif protocol.protocol_ns.startswith(Namespace.ISO_V20_BASE):
-                    self.comm_session.protocol = Protocol.get_by_ns(
-                        protocol.protocol_ns
-                    )
-                    header = MessageHeaderV20(
-                        session_id=self.get_session_id(), timestamp=time.time()
-                    )
-                    next_msg = SessionSetupReqV20(
-                        header=header,
-                        evcc_id=await self.comm_session.ev_controller.get_evcc_id(
-                            self.comm_session.protocol, self.comm_session.config.iface
-                        ),
-                    )
-                    next_ns = Namespace.ISO_V20_COMMON_MSG
-                    next_state = SessionSetupV20
-                else:
-                    # This should not happen because the EVCC previously
-                    # should have sent a valid SupportedAppProtocolReq
-                    logger.error(
-                        "EVCC sent an invalid protocol namespace in "
-                        f"its previous SupportedAppProtocolReq: "
-                        f"{protocol.protocol_ns}. Allowed namespaces are:"
-                        f" {self.comm_session.config.supported_protocols}"
-                    )
-                    raise MessageProcessingError("SupportedAppProtocolReq")
-                break
-
-        if match:
+        if protocol:
+            builder = _NS_DISPATCH.get(protocol.protocol_ns) or (
+                _build_session_setup_v20
+                if protocol.protocol_ns.startswith(Namespace.ISO_V20_BASE)
+                else None
+            )
+            if not builder:
+                # This should not happen because the EVCC previously
+                # should have sent a valid SupportedAppProtocolReq
+                logger.error(
+                    "EVCC sent an invalid protocol namespace in "
+                    f"its previous SupportedAppProtocolReq: "
+                    f"{protocol.protocol_ns}. Allowed namespaces are:"
+                    f" {self.comm_session.config.supported_protocols}"
+                )
+                raise MessageProcessingError("SupportedAppProtocolReq")
+
+            next_msg, next_ns, next_state = await builder(self, protocol.protocol_ns)
+
             logger.debug(f"Chosen protocol: {self.comm_session.protocol}")
             self.create_next_message(
                 next_state, next_msg, Timeouts.SESSION_SETUP_REQ, next_ns
@@ -163,6 +179,6 @@ class SupportedAppProtocol(StateEVCC):
             self.comm_session.session_id = evcc_settings.RESUME_SESSION_ID
             evcc_settings.RESUME_SESSION_ID = None
         else:
-            self.comm_session.session_id = bytes(1).hex().upper()
+            self.comm_session.session_id = _DEFAULT_SESSION_ID
 
         return self.comm_session.session_id
@@ -8,7 +8,6 @@ from iso15118.secc.secc_settings import Config
 from iso15118.shared.iexi_codec import IEXICodec
 from iso15118.shared.logging import _init_logger
 
-_init_logger()
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +18,7 @@ class SECCHandler(CommunicationSessionHandler):
         evse_controller: EVSEControllerInterface,
         env_path: Optional[str] = None,
     ):
+        _init_logger()
         config = Config()
         config.load_envs(env_path)
         CommunicationSessionHandler.__init__(
@@ -3,7 +3,7 @@ import logging
 
 from iso15118.secc import SECCHandler
 from iso15118.secc.controller.simulator import SimEVSEController
-from iso15118.shared.exificient_exi_codec import ExificientEXICodec
+from iso15118.shared.exificient_exi_codec import get_shared_exificient_codec
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,7 @@ async def main():
     """
     sim_evse_controller = await SimEVSEController.create()
     await SECCHandler(
-        exi_codec=ExificientEXICodec(), evse_controller=sim_evse_controller
+        exi_codec=get_shared_exificient_codec(), evse_controller=sim_evse_controller
     ).start()
 
 
@@ -1,3 +1,3 @@
-from iso15118.shared.logging import _init_logger
+from iso15118.shared.logging import _add_trace_level
 
-_init_logger()
+_add_trace_level()
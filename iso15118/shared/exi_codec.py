@@ -10,7 +10,7 @@ from iso15118.shared.exceptions import (
     EXIEncodingError,
     V2GMessageValidationError,
 )
-from iso15118.shared.exificient_exi_codec import ExificientEXICodec
+from iso15118.shared.exificient_exi_codec import get_shared_exificient_codec
 from iso15118.shared.iexi_codec import IEXICodec
 from iso15118.shared.messages import BaseModel
 from iso15118.shared.messages.app_protocol import (
@@ -171,7 +171,10 @@ class EXI:
         return cls._instance
 
     def set_exi_codec(self, codec: IEXICodec):
-        logger.info(f"EXI Codec version: {codec.get_version()}")
+        # Not logging the codec version here, as retrieving it could block
+        # until a codec that initialises in the background (e.g. the
+        # ExificientEXICodec, which launches a JVM) is ready
+        logger.info(f"EXI Codec: {codec.__class__.__name__}")
         self.exi_codec = codec
 
     def get_exi_codec(self) -> IEXICodec:
@@ -179,7 +182,7 @@ class EXI:
         If exi_codec is not specified return an instance of the default codec Exificient
         """
         if self.exi_codec is None:
-            self.exi_codec = ExificientEXICodec()
+            self.exi_codec = get_shared_exificient_codec()
         return self.exi_codec
 
     def to_exi(self, msg_element: BaseModel, protocol_ns: str) -> bytes:
@@ -1,37 +1,192 @@
 import json
 import logging
+import threading
 from builtins import Exception
+from typing import Optional
 
+from iso15118.shared.exceptions import EXIDecodingError, EXIEncodingError
 from iso15118.shared.iexi_codec import IEXICodec
+from iso15118.shared.messages.enums import Namespace
 from iso15118.shared.settings import JAR_FILE_PATH
 
 logger = logging.getLogger(__name__)
 
+# Stopping at the C1 JIT compiler (TieredStopAtLevel=1) leaves out the C2
+# compilations, which cost more CPU time during warm-up than they save on the
+# short messages exchanged with the EXI codec
+JAVA_OPTS = [
+    "--add-opens",
+    "java.base/java.lang=ALL-UNNAMED",
+    "-XX:TieredStopAtLevel=1",
+]
+
+# A minimal message per schema that every communication session goes through
+# first (SupportedAppProtocol and SessionSetup), used to let EXIficient build
+# and the JVM JIT-compile the corresponding grammars before the first session
+_PRELOAD_MESSAGES = {
+    Namespace.SAP: (
+        '{"supportedAppProtocolReq": {"AppProtocol": [{"ProtocolNamespace": '
+        '"urn:iso:15118:2:2013:MsgDef", "VersionNumberMajor": 2, '
+        '"VersionNumberMinor": 0, "SchemaID": 1, "Priority": 1}]}}'
+    ),
+    Namespace.ISO_V2_MSG_DEF: (
+        '{"V2G_Message": {"Header": {"SessionID": "00"}, '
+        '"Body": {"SessionSetupReq": {"EVCCID": "000000000000"}}}}'
+    ),
+    Namespace.DIN_MSG_DEF: (
+        '{"V2G_Message": {"Header": {"SessionID": "00"}, '
+        '"Body": {"SessionSetupReq": {"EVCCID": "000000000000"}}}}'
+    ),
+    Namespace.ISO_V20_COMMON_MSG: (
+        '{"SessionSetupReq": {"Header": {"SessionID": "00", "TimeStamp": 0}, '
+        '"EVCCID": "WMIV1234567890ABCDEX"}}'
+    ),
+}
+
 
 def compare_messages(json_to_encode, decoded_json):
-    json_obj = json.loads(json_to_encode)
-    decoded_json_obj = json.loads(decoded_json)
-    return sorted(json_obj.items()) == sorted(decoded_json_obj.items())
+    return json.loads(json_to_encode) == json.loads(decoded_json)
+
+
+_shared_codec: Optional["ExificientEXICodec"] = None
+
+
+def get_shared_exificient_codec() -> "ExificientEXICodec":
+    """
+    Returns the process-wide ExificientEXICodec. Each instance launches its
+    own JVM and builds its own EXI grammars, so all charging sessions share a
+    single instance instead.
+    """
+    global _shared_codec
+    if _shared_codec is None:
+        _shared_codec = ExificientEXICodec()
+    return _shared_codec
 
 
 class ExificientEXICodec(IEXICodec):
     def __init__(self):
-        from py4j.java_gateway import JavaGateway
+        self.gateway = None
+        self.exi_codec = None
+        self.protocol_schema_mapping = {}
+
+        # Starting the JVM takes a while, so it is launched in the background
+        # and only waited for once the codec is actually used (e.g. while the
+        # SDP exchange is still ongoing, no EXI encoding is required yet).
+        # Note that this first use blocks the calling thread - and with it the
+        # asyncio event loop - until the JVM is up, so the codec should be
+        # created at start-up, well before the first communication session.
+        self._init_error: Optional[Exception] = None
+        self._init_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._launch_gateway, daemon=True
+        )
+        self._init_thread.start()
+
+    def _launch_gateway(self):
+        try:
+            self._init_gateway()
+        except Exception as exc:
+            self._init_error = exc
+            return
+
+        logger.info(f"EXI Codec version: {self.exi_codec.get_version()}")
+        try:
+            self._preload_grammars()
+        except Exception as exc:
+            # Preloading only saves time, the codec is usable without it
+            logger.warning(f"Unable to preload EXI grammars: {exc}")
+
+    def _preload_grammars(self):
+        """
+        Encodes and decodes a dummy message per schema, so that the first
+        messages of a communication session don't have to wait for the EXI
+        grammars to be built. Runs in the thread launching the gateway, hence
+        calls the Java codec directly instead of encode() and decode().
+        """
+        for namespace, message in _PRELOAD_MESSAGES.items():
+            exi = self.exi_codec.encode(message, namespace)
+            if exi is None:
+                logger.warning(
+                    f"Unable to preload EXI grammar for {namespace}: "
+                    f"{self.exi_codec.get_last_encoding_error()}"
+                )
+                continue
+            self.exi_codec.decode_exi(exi, self.protocol_schema_mapping[namespace])
+
+    def _init_gateway(self):
+        from py4j.java_gateway import (
+            GatewayParameters,
+            JavaGateway,
+            java_import,
+            launch_gateway,
+        )
 
         logging.getLogger("py4j").setLevel(logging.CRITICAL)
-        self.gateway = JavaGateway.launch_gateway(
+        port, java_process = launch_gateway(
             classpath=JAR_FILE_PATH,
             die_on_exit=False,
-            javaopts=["--add-opens", "java.base/java.lang=ALL-UNNAMED"],
+            javaopts=JAVA_OPTS,
+            return_proc=True,
+        )
+        # With eager_load, the connection to the gateway is established (and
+        # checked) right here instead of during the first encode/decode call
+        self.gateway = JavaGateway(
+            gateway_parameters=GatewayParameters(port=port, eager_load=True),
+            java_process=java_process,
         )
 
-        self.exi_codec = self.gateway.jvm.com.siemens.ct.exi.main.cmd.EXICodec()
+        # Each step of a fully qualified name on the JVM view (com, siemens,
+        # ct, ...) is a round-trip to the gateway. Importing the package once
+        # lets us resolve its classes by their simple name in a single call.
+        java_import(self.gateway.jvm, "com.siemens.ct.exi.main.cmd.*")
+        self.exi_codec = self.gateway.jvm.EXICodec()
+
+        # Resolve the Java schema enum references once, as each attribute
+        # access on the JVM view is a round-trip to the gateway
+        built_in_schema = self.gateway.jvm.BuiltInSchema
+        self.protocol_schema_mapping = {
+            Namespace.SAP: built_in_schema.AppProtocol,
+            Namespace.DIN_MSG_DEF: built_in_schema.DINSpec_70121,
+            Namespace.ISO_V2_MSG_DEF: built_in_schema.ISO15118_2,
+            Namespace.ISO_V20_COMMON_MSG: (
+                built_in_schema.ISO15118_20_V2G_CI_CommonMessages
+            ),
+            Namespace.ISO_V20_AC: built_in_schema.ISO15118_20_V2G_CI_AC,
+            Namespace.ISO_V20_DC: built_in_schema.ISO15118_20_V2G_CI_DC,
+            Namespace.ISO_V20_WPT: built_in_schema.ISO15118_20_V2G_CI_WPT,
+            Namespace.ISO_V20_ACDP: built_in_schema.ISO15118_20_V2G_CI_ACDP,
+            Namespace.XML_DSIG: built_in_schema.XSDCore,
+        }
+
+    def _wait_for_gateway(self):
+        """
+        Blocks until the JVM launched in the background is ready to be used.
+
+        Raises:
+            EXIEncodingError, if launching the JVM failed
+        """
+        if self._init_thread is not None:
+            self._init_thread.join()
+            self._init_thread = None
+
+        if self._init_error is not None:
+            raise EXIEncodingError(
+                "Unable to launch the EXI codec gateway"
+            ) from self._init_error
+
+    def get_schema(self, schema_ns: str):
+        """
+        Returns the (already resolved) Java BuiltInSchema enum reference for the
+        given namespace, or None if there is no EXI schema for it.
+        """
+        self._wait_for_gateway()
+        return self.protocol_schema_mapping.get(schema_ns)
 
     def encode(self, message: str, namespace: str) -> bytes:
         """
         Calls the Exificient EXI implmentation to encode input json.
         Returns a byte[] for the input message if conversion was successful.
         """
+        self._wait_for_gateway()
         exi = self.exi_codec.encode(message, namespace)
 
         if exi is None:
@@ -44,7 +199,19 @@ class ExificientEXICodec(IEXICodec):
         Returns a JSON representation of the input EXI stream if the conversion
         was successful.
         """
-        decoded_message = self.exi_codec.decode(stream, namespace)
+        self._wait_for_gateway()
+
+        if not isinstance(stream, (bytes, bytearray)):
+            # Py4J only transfers bytes and bytearray objects as a Java byte[]
+            # (any other buffer, like a memoryview, would be sent as an object
+            # reference), so make sure the stream takes that path
+            stream = bytes(stream)
+
+        schema = self.get_schema(namespace)
+        if schema is None:
+            raise EXIDecodingError(f"No EXI schema for namespace {namespace}")
+
+        decoded_message = self.exi_codec.decode_exi(stream, schema)
 
         if decoded_message is None:
             raise Exception(self.exi_codec.get_last_decoding_error())
@@ -54,4 +221,5 @@ class ExificientEXICodec(IEXICodec):
         """
         Returns the version of the Exificient codec
         """
+        self._wait_for_gateway()
         return self.exi_codec.get_version()
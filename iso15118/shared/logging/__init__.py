@@ -18,10 +18,25 @@ LOG_LEVEL = env.str("LOG_LEVEL", default="INFO")
 env.seal()  # raise all errors at once, if any
 
 
+_logger_initialised = False
+
+
 def _init_logger():
+    """
+    Configures the logging tree from the logging.conf file. Meant to be called
+    by the entry points (the EVCC and SECC handlers) rather than at import time,
+    and only configures the logging tree once, however often it is called.
+    """
+    global _logger_initialised
+    if _logger_initialised:
+        return
+
     logging.config.fileConfig(fname=LOGGER_CONF_PATH, disable_existing_loggers=False)
     logging.getLogger().setLevel(LOG_LEVEL)
+    _logger_initialised = True
+
 
+def _add_trace_level():
     # An extra logging level if required.
     def trace(self, message, *args, **kwargs):
         pass
@@ -45,6 +45,7 @@ class MessageHeader(BaseModel):
 
     # XSD type hexBinary with max 8 bytes encoded as 16 hexadecimal characters
     session_id: str = Field(..., max_length=16, alias="SessionID")
+    # XSD type unsignedLong, given as Unix time in seconds (not nanoseconds)
     timestamp: int = Field(..., alias="TimeStamp")
     signature: Signature = Field(None, alias="Signature")
 
@@ -1,4 +1,5 @@
 import logging
+import struct
 from typing import Union
 
 from iso15118.shared.exceptions import (
@@ -17,6 +18,10 @@ from iso15118.shared.messages.enums import (
 
 logger = logging.getLogger(__name__)
 
+# Protocol version, inverse protocol version, payload type, and payload length
+# (see the V2GTPMessage docstring), in network byte order
+V2GTP_HEADER = struct.Struct(">BBHI")
+
 
 class V2GTPMessage:
     def __init__(
@@ -73,7 +78,7 @@ class V2GTPMessage:
     @staticmethod
     def get_payload_type(header: bytes) -> int:
         if len(header) == 8:
-            return int.from_bytes(header[2:4], "big")
+            return V2GTP_HEADER.unpack(header)[2]
 
         # Returning a non-positive number guarantees that any upper-level checks
         # comparing the returned payload type with an expected one will fail
@@ -82,7 +87,7 @@ class V2GTPMessage:
     @staticmethod
     def get_payload_length(header: bytes) -> int:
         if len(header) == 8:
-            return int.from_bytes(header[4:], "big")
+            return V2GTP_HEADER.unpack(header)[3]
 
         # Return -1 to show we're unable to determine the payload length
         return -1
@@ -160,15 +165,18 @@ class V2GTPMessage:
 
         return is_valid
 
-    def to_bytes(self) -> bytes:
-        header = (
-            self.protocol_version.to_bytes(1, "big")
-            + self.inv_protocol_version.to_bytes(1, "big")
-            + self.payload_type.to_bytes(2, "big")
-            + self.payload_length.to_bytes(4, "big")
+    def get_header(self) -> bytes:
+        return V2GTP_HEADER.pack(
+            self.protocol_version,
+            self.inv_protocol_version,
+            self.payload_type,
+            self.payload_length,
         )
 
-        return bytes(header) + self.payload
+    def to_bytes(self) -> bytes:
+        # The payload (e.g. the EXI stream returned by the EXI codec) is
+        # copied exactly once, when appending it to the header
+        return self.get_header() + self.payload
 
     @classmethod
     def from_bytes(cls, protocol: Protocol, data: bytes) -> "V2GTPMessage":
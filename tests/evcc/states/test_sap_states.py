@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from iso15118.evcc.states.din_spec_states import SessionSetup as SessionSetupDINSPEC
+from iso15118.evcc.states.iso15118_2_states import SessionSetup as SessionSetupV2
+from iso15118.evcc.states.iso15118_20_states import SessionSetup as SessionSetupV20
+from iso15118.evcc.states.sap_states import SupportedAppProtocol
+from iso15118.shared.messages.app_protocol import (
+    AppProtocol,
+    ResponseCodeSAP,
+    SupportedAppProtocolRes,
+)
+from iso15118.shared.messages.enums import Protocol
+from iso15118.shared.states import Terminate
+
+
+def get_supported_protocols_by_schema_id():
+    protocols = [
+        Protocol.ISO_15118_20_AC,
+        Protocol.ISO_15118_2,
+        Protocol.DIN_SPEC_70121,
+    ]
+    return {
+        schema_id: AppProtocol(
+            protocol_ns=protocol.ns.value,
+            major_version=1,
+            minor_version=0,
+            schema_id=schema_id,
+            priority=schema_id,
+        )
+        for schema_id, protocol in enumerate(protocols, start=1)
+    }
+
+
+@patch("iso15118.shared.states.EXI.to_exi", new=Mock(return_value=b"01"))
+@pytest.mark.asyncio
+class TestSupportedAppProtocol:
+    @pytest.fixture(autouse=True)
+    def _comm_session(self, comm_evcc_session_mock):
+        self.comm_session = comm_evcc_session_mock
+        self.comm_session.config = Mock(iface="lo")
+        self.comm_session.writer = Mock()
+        self.comm_session.supported_protocols_by_schema_id = (
+            get_supported_protocols_by_schema_id()
+        )
+
+    @pytest.mark.parametrize(
+        "schema_id, expected_protocol, expected_next_state",
+        [
+            (1, Protocol.ISO_15118_20_AC, SessionSetupV20),
+            (2, Protocol.ISO_15118_2, SessionSetupV2),
+            (3, Protocol.DIN_SPEC_70121, SessionSetupDINSPEC),
+        ],
+    )
+    async def test_sap_res_selects_protocol_by_schema_id(
+        self, schema_id, expected_protocol, expected_next_state
+    ):
+        sap = SupportedAppProtocol(self.comm_session)
+        await sap.process_message(
+            message=SupportedAppProtocolRes(
+                response_code=ResponseCodeSAP.NEGOTIATION_OK, schema_id=schema_id
+            )
+        )
+        assert self.comm_session.protocol == expected_protocol
+        assert self.comm_session.session_id == "00"
+        assert sap.next_state == expected_next_state
+
+    async def test_sap_res_with_unknown_schema_id_terminates(self):
+        sap = SupportedAppProtocol(self.comm_session)
+        await sap.process_message(
+            message=SupportedAppProtocolRes(
+                response_code=ResponseCodeSAP.NEGOTIATION_OK, schema_id=10
+            )
+        )
+        assert sap.next_state == Terminate
+
+    @pytest.mark.parametrize(
+        "schema_id, expected_protocol",
+        [
+            (1, Protocol.ISO_15118_20_AC),
+            (2, Protocol.ISO_15118_2),
+            (3, Protocol.DIN_SPEC_70121),
+        ],
+    )
+    async def test_sap_res_requests_evcc_id_once(self, schema_id, expected_protocol):
+        ev_controller = self.comm_session.ev_controller
+        ev_controller.get_evcc_id = AsyncMock(wraps=ev_controller.get_evcc_id)
+        sap = SupportedAppProtocol(self.comm_session)
+        await sap.process_message(
+            message=SupportedAppProtocolRes(
+                response_code=ResponseCodeSAP.NEGOTIATION_OK, schema_id=schema_id
+            )
+        )
+        ev_controller.get_evcc_id.assert_awaited_once_with(expected_protocol, "lo")
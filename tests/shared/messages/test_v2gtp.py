@@ -0,0 +1,35 @@
+import pytest
+
+from iso15118.shared.messages.enums import (
+    ISOV2PayloadTypes,
+    ISOV20PayloadTypes,
+    Protocol,
+)
+from iso15118.shared.messages.v2gtp import V2GTPMessage
+
+
+class TestV2GTPMessage:
+    def test_to_bytes_prepends_v2gtp_header(self):
+        message = V2GTPMessage(
+            Protocol.ISO_15118_2, ISOV2PayloadTypes.EXI_ENCODED, b"\x80\x98\x02"
+        )
+
+        assert message.to_bytes() == bytes.fromhex("01fe800100000003809802")
+        assert message.get_header() == bytes.fromhex("01fe800100000003")
+
+    @pytest.mark.parametrize(
+        "protocol, payload_type",
+        [
+            (Protocol.ISO_15118_2, ISOV2PayloadTypes.EXI_ENCODED),
+            (Protocol.ISO_15118_20_AC, ISOV20PayloadTypes.AC_MAINSTREAM),
+        ],
+    )
+    def test_from_bytes_restores_message(self, protocol, payload_type):
+        payload = bytes(range(20))
+        data = V2GTPMessage(protocol, payload_type, payload).to_bytes()
+
+        message = V2GTPMessage.from_bytes(protocol, data)
+
+        assert message.payload_type == payload_type
+        assert message.payload_length == len(payload)
+        assert message.payload == payload
@@ -0,0 +1,26 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from iso15118.shared.comm_session import V2GCommunicationSession
+from iso15118.shared.messages.enums import ISOV2PayloadTypes, Protocol
+from iso15118.shared.messages.v2gtp import V2GTPMessage
+
+
+@pytest.mark.asyncio
+class TestV2GCommunicationSession:
+    async def test_send_writes_whole_v2gtp_message_at_once(self):
+        comm_session = Mock(writer=Mock(drain=AsyncMock()))
+        message = V2GTPMessage(
+            Protocol.ISO_15118_2, ISOV2PayloadTypes.EXI_ENCODED, b"\x80\x98\x02"
+        )
+
+        await V2GCommunicationSession.send(comm_session, message)
+
+        # A single write, so that the V2GTP header and the EXI payload end up
+        # in the same TLS record
+        comm_session.writer.write.assert_called_once_with(
+            bytes.fromhex("01fe800100000003809802")
+        )
+        comm_session.writer.drain.assert_awaited_once()
+        assert comm_session.last_message_sent is message
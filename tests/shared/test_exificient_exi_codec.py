@@ -0,0 +1,130 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from iso15118.shared.exceptions import EXIDecodingError, EXIEncodingError
+from iso15118.shared.exificient_exi_codec import (
+    ExificientEXICodec,
+    get_shared_exificient_codec,
+)
+from iso15118.shared.messages.enums import Namespace
+
+EXI_STREAM = b"\x80\x98\x02"
+
+
+@pytest.fixture
+def launch_gateway():
+    with patch(
+        "py4j.java_gateway.launch_gateway", return_value=(25333, Mock())
+    ) as launch_gateway_mock:
+        yield launch_gateway_mock
+
+
+@pytest.fixture
+def java_gateway(launch_gateway):
+    with patch("py4j.java_gateway.java_import"), patch(
+        "py4j.java_gateway.JavaGateway"
+    ) as gateway_class:
+        yield gateway_class.return_value
+
+
+class TestExificientEXICodec:
+    @pytest.mark.parametrize(
+        "use_codec",
+        [
+            lambda codec: codec.encode("{}", Namespace.SAP),
+            lambda codec: codec.decode(EXI_STREAM, Namespace.SAP),
+            lambda codec: codec.get_version(),
+        ],
+    )
+    def test_codec_waits_for_gateway(self, launch_gateway, java_gateway, use_codec):
+        jvm_launched = threading.Event()
+
+        def launch(*args, **kwargs):
+            jvm_launched.wait(5)
+            return 25333, Mock()
+
+        launch_gateway.side_effect = launch
+        codec = ExificientEXICodec()
+        user = threading.Thread(target=use_codec, args=(codec,))
+        user.start()
+
+        user.join(0.1)
+        assert user.is_alive()
+        assert codec.exi_codec is None
+
+        jvm_launched.set()
+        user.join(5)
+        assert not user.is_alive()
+        assert codec.exi_codec is java_gateway.jvm.EXICodec.return_value
+
+    @pytest.mark.parametrize(
+        "use_codec",
+        [
+            lambda codec: codec.encode("{}", Namespace.SAP),
+            lambda codec: codec.decode(EXI_STREAM, Namespace.SAP),
+            lambda codec: codec.get_version(),
+        ],
+    )
+    def test_gateway_launch_error_is_raised(
+        self, launch_gateway, java_gateway, use_codec
+    ):
+        launch_gateway.side_effect = OSError("java not found")
+        codec = ExificientEXICodec()
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(EXIEncodingError) as exc_info:
+                use_codec(codec)
+            assert isinstance(exc_info.value.__cause__, OSError)
+            errors.append(exc_info.value)
+        # A new exception per call, so the traceback doesn't keep on growing
+        assert errors[0] is not errors[1]
+
+    def test_get_schema_does_not_cache_launch_error(self, launch_gateway, java_gateway):
+        launch_gateway.side_effect = OSError("java not found")
+        codec = ExificientEXICodec()
+
+        for _ in range(2):
+            with pytest.raises(EXIEncodingError):
+                codec.get_schema(Namespace.SAP)
+
+    def test_decode_with_unknown_namespace_raises(self, java_gateway):
+        codec = ExificientEXICodec()
+        codec.get_version()
+        java_codec = java_gateway.jvm.EXICodec.return_value
+        java_codec.decode_exi.reset_mock()
+
+        with pytest.raises(EXIDecodingError):
+            codec.decode(EXI_STREAM, "urn:unknown")
+        java_codec.decode_exi.assert_not_called()
+
+    def test_decode_uses_schema_of_namespace(self, java_gateway):
+        codec = ExificientEXICodec()
+        codec.get_version()
+        java_codec = java_gateway.jvm.EXICodec.return_value
+
+        codec.decode(EXI_STREAM, Namespace.ISO_V2_MSG_DEF)
+
+        java_codec.decode_exi.assert_called_with(
+            EXI_STREAM, java_gateway.jvm.BuiltInSchema.ISO15118_2
+        )
+
+    def test_failed_grammar_preload_keeps_codec_usable(self, java_gateway):
+        java_codec = java_gateway.jvm.EXICodec.return_value
+        java_codec.encode.side_effect = [RuntimeError("OutOfMemoryError"), EXI_STREAM]
+        with patch("threading.excepthook") as excepthook:
+            codec = ExificientEXICodec()
+
+            assert codec.encode("{}", Namespace.SAP) == EXI_STREAM
+        excepthook.assert_not_called()
+
+
+@patch("iso15118.shared.exificient_exi_codec._shared_codec", new=None)
+def test_shared_exificient_codec_is_reused(java_gateway):
+    codec = get_shared_exificient_codec()
+    codec.get_version()
+
+    assert get_shared_exificient_codec() is codec
+    java_gateway.jvm.EXICodec.assert_called_once()